@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 import warnings
 from typing import Literal
 
@@ -366,7 +367,7 @@ def _mask_2D(
     if as_3D:
         mask = _3D_to_2D_mask(mask, numbers)
 
-    if np.all(np.isnan(mask)):
+    if np.isnan(mask.values).all():
         msg = "No gridpoint belongs to any region. Returning an all-NaN mask."
         warnings.warn(msg, UserWarning, stacklevel=3)
 
@@ -422,11 +423,13 @@ def _mask_3D(
 def _2D_to_3D_mask(mask: xr.DataArray, numbers, *, drop: bool) -> xr.DataArray:
     # TODO: unify with _3D_to_3D_mask
 
-    isnan = np.isnan(mask.values)
+    values = mask.values
 
     if drop:
-        numbers = np.unique(mask.values[~isnan])
-        numbers = numbers.astype(int)
+        # only the region numbers can occur in the mask: checking which of them are
+        # present is faster than finding the unique values of the (large) mask
+        numbers = np.asarray(numbers)
+        numbers = np.sort(numbers[np.isin(numbers, values)]).astype(int)
 
     # if no regions are found return a `0 x lat x lon` mask
     if len(numbers) == 0:
@@ -442,11 +445,18 @@ def _2D_to_3D_mask(mask: xr.DataArray, numbers, *, drop: bool) -> xr.DataArray:
 
         return mask_3D
 
-    lst_msk = [(mask == num) for num in numbers]
-    mask_3D = xr.concat(lst_msk, dim="region", compat="override", coords="minimal")
+    # compare against all numbers at once (broadcasting) instead of concatenating
+    # one DataArray per region
+    numbers = np.asarray(numbers)
+    data = values[np.newaxis, ...] == numbers.reshape((-1,) + (1,) * values.ndim)
+
+    mask_3D = xr.DataArray(
+        data, coords=mask.coords, dims=("region",) + mask.dims, name=mask.name
+    )
     mask_3D = mask_3D.assign_coords(region=("region", numbers))
 
-    if np.all(isnan):
+    # with drop=True at least one of the numbers is in the mask - no need to check
+    if not drop and np.isnan(values).all():
         warnings.warn(
             "No gridpoint belongs to any region. Returning an all-False mask.",
             UserWarning,
@@ -519,18 +529,25 @@ def _3D_to_2D_mask(mask_3D: xr.DataArray, numbers) -> xr.DataArray:
     return mask_2D
 
 
-def _determine_method(
-    lon, lat
-) -> Literal["rasterize", "rasterize_flip", "rasterize_split", "shapely"]:
+_Methods = Literal["rasterize", "rasterize_flip", "rasterize_split", "shapely"]
+
+
+def _determine_method(lon, lat) -> _Methods:
     """find method to be used -> prefers faster methods"""
 
-    if equally_spaced(lon, lat):
+    lon, lat = np.asarray(lon), np.asarray(lat)
+
+    # all rasterize methods require equally spaced lat - check it only once
+    if not equally_spaced(lat):
+        return "shapely"
+
+    if equally_spaced(lon):
         return "rasterize"
 
-    if _equally_spaced_on_split_lon(lon) and equally_spaced(lat):
+    if _equally_spaced_on_split_lon(lon):
 
         split_point = _find_splitpoint(lon)
-        flipped_lon = np.hstack((lon[split_point:], lon[:split_point]))
+        flipped_lon = np.roll(lon, -split_point)
 
         if equally_spaced(flipped_lon):
             return "rasterize_flip"
@@ -587,6 +604,14 @@ def _mask_edgepoints_shapely(
     as_3D=False,
 ) -> np.ndarray:
 
+    lon, lat = np.asarray(lon), np.asarray(lat)
+
+    # return early if no gridpoint lies at -180°E/0°E or -90°N - checking lon and
+    # lat avoids creating the 2D coordinates for the full grid
+    lon_edge = -180.0 if np.nanmin(lon) < 0 else 0.0
+    if not (np.isclose(lon, lon_edge).any() or np.isclose(lat, -90).any()):
+        return mask
+
     LON, LAT, shape = _get_LON_LAT_shape(
         lon, lat, numbers, is_unstructured=is_unstructured, as_3D=as_3D
     )
@@ -626,20 +651,18 @@ def _mask_edgepoints_shapely(
     # "mask[borderpoints][sel] = number" does not work, need to use np.where
     idx = np.where(borderpoints)[0]
 
-    polys = np.array(polygons).reshape(-1, 1)
-    arr = shapely.contains_xy(polys, LON, LAT)
-
-    if as_3D:
-        for i in range(len(polygons)):
-            mask[i, idx[arr[i, :]]] = True
+    tree = shapely.STRtree(shapely.points(LON, LAT))
+    a, b = tree.query(polygons, predicate="contains")
 
-    else:
-        for i in range(len(polygons)):
-            mask[idx[arr[i, :]]] = numbers[i]
+    _assign_contained(mask, a, idx[b], numbers, as_3D=as_3D)
 
     return mask.reshape(shape)
 
 
+# minimum number of gridpoints per box to mask them with ``_query_boxes``
+_MIN_POINTS_PER_BOX = 10
+
+
 def _mask_shapely(
     lon, lat, polygons, numbers, *, fill=np.nan, is_unstructured=False, as_3D=False
 ) -> np.ndarray:
@@ -647,29 +670,159 @@ def _mask_shapely(
 
     lon, lat = _parse_input(lon, lat, polygons, fill, numbers)
 
-    LON, LAT, shape = _get_LON_LAT_shape(
-        lon, lat, numbers, is_unstructured=is_unstructured, as_3D=as_3D
-    )
+    # add a tiny offset to get a consistent edge behaviour
+    lon = lon - 1 * 10**-8
+    lat = lat - 1 * 10**-10
+
+    # only gridpoints within the bounds of the polygons can be contained - building
+    # the tree is the most expensive step, so this is worthwhile for regional masks
+    xmin, ymin, xmax, ymax = _total_bounds(polygons)
+
+    if lon.ndim == 1 and lat.ndim == 1 and not is_unstructured:
+        # regular grid: select along each axis & only create the required 2D coords
+        idx_lon = np.flatnonzero((lon >= xmin) & (lon <= xmax))
+        idx_lat = np.flatnonzero((lat >= ymin) & (lat <= ymax))
+
+        idx = (idx_lat[:, np.newaxis] * lon.size + idx_lon).ravel()
+        LON, LAT = np.meshgrid(lon[idx_lon], lat[idx_lat])
+
+        shape: tuple[int, ...] = (lat.size, lon.size)
+        if as_3D:
+            shape = (len(numbers),) + shape
+    else:
+        LON, LAT, shape = _get_LON_LAT_shape(
+            lon, lat, numbers, is_unstructured=is_unstructured, as_3D=as_3D
+        )
+
+        in_bounds = (LON >= xmin) & (LON <= xmax) & (LAT >= ymin) & (LAT <= ymax)
+        idx = np.flatnonzero(in_bounds)
+        LON, LAT = LON[idx], LAT[idx]
+
     out = _get_out(shape, fill, as_3D=as_3D)
 
-    # add a tiny offset to get a consistent edge behaviour
-    LON = LON - 1 * 10**-8
-    LAT = LAT - 1 * 10**-10
+    LON, LAT = LON.ravel(), LAT.ravel()
+
+    # axis-aligned rectangles contain exactly the points strictly within their bounds
+    # and need no point-in-polygon test (e.g. the giorgi or prudence regions) - this is
+    # only faster than the STRtree if there are considerably fewer boxes than points
+    polygons = np.asarray(polygons)
+    bounds = shapely.bounds(polygons)
+    is_box = _is_box(polygons, bounds)
+    if is_box.sum() * _MIN_POINTS_PER_BOX > LON.size:
+        is_box[:] = False
+
+    a_box, b_box = _query_boxes(bounds[is_box], LON, LAT)
+    a_box = np.flatnonzero(is_box)[a_box]
+
+    a_poly, b_poly = _query_contained(polygons[~is_box], LON, LAT)
+    a_poly = np.flatnonzero(~is_box)[a_poly]
+
+    a = np.concatenate([a_box, a_poly]).astype(np.intp)
+    b = np.concatenate([b_box, b_poly]).astype(np.intp)
+
+    _assign_contained(out, a, idx[b], numbers, as_3D=as_3D)
+
+    return out.reshape(shape)
+
+
+def _is_box(polygons, bounds):
+    """determine which polygons are axis-aligned rectangles"""
+
+    # cheap pre-selection (does not copy the coords): a box has exactly 5 vertices
+    # (any hole would add at least 4 more) - only these are compared to their bounds
+    candidate = shapely.get_num_coordinates(polygons) == 5
+
+    is_box = np.zeros(len(polygons), dtype=bool)
+    if not candidate.any():
+        return is_box
+
+    # compare the coords directly, much faster than shapely.equals
+    xy = shapely.get_coordinates(polygons[candidate]).reshape(-1, 5, 2)
+    xmin, ymin, xmax, ymax = (b[:, np.newaxis] for b in bounds[candidate].T)
+
+    # all vertices are corners of the bounds
+    on_x = (xy[..., 0] == xmin) | (xy[..., 0] == xmax)
+    on_y = (xy[..., 1] == ymin) | (xy[..., 1] == ymax)
+
+    # the edges alternate between parallel to the lon and to the lat axis
+    d_xy = np.diff(xy, axis=1)
+    along_x = (d_xy[..., 0] != 0) & (d_xy[..., 1] == 0)
+    along_y = (d_xy[..., 0] == 0) & (d_xy[..., 1] != 0)
+    x_first = (along_x[:, ::2] & along_y[:, 1::2]).all(axis=1)
+    y_first = (along_y[:, ::2] & along_x[:, 1::2]).all(axis=1)
+
+    is_box[candidate] = (on_x & on_y).all(axis=1) & (x_first | y_first)
+
+    return is_box
+
+
+def _query_boxes(bounds, LON, LAT):
+    """find all box-point pairs where the point lies strictly within the box"""
+
+    if len(bounds) == 0:
+        return np.array([], dtype=np.intp), np.array([], dtype=np.intp)
+
+    # sort the points by lon and by lat - for each box only the points within its lon
+    # or lat range (whichever contains fewer points) need to be checked
+    order_lon = np.argsort(LON, kind="stable")
+    order_lat = np.argsort(LAT, kind="stable")
+
+    x0 = np.searchsorted(LON[order_lon], bounds[:, 0], side="right")
+    x1 = np.searchsorted(LON[order_lon], bounds[:, 2], side="left")
+    y0 = np.searchsorted(LAT[order_lat], bounds[:, 1], side="right")
+    y1 = np.searchsorted(LAT[order_lat], bounds[:, 3], side="left")
+
+    use_lon = (x1 - x0) <= (y1 - y0)
+
+    a, b = [], []
+    for i, (xmin, ymin, xmax, ymax) in enumerate(bounds):
+        if use_lon[i]:
+            candidates = order_lon[x0[i] : x1[i]]
+            coord = LAT[candidates]
+            sel = candidates[(ymin < coord) & (coord < ymax)]
+        else:
+            candidates = order_lat[y0[i] : y1[i]]
+            coord = LON[candidates]
+            sel = candidates[(xmin < coord) & (coord < xmax)]
+
+        a.append(np.full(sel.size, i, dtype=np.intp))
+        b.append(sel)
+
+    return np.concatenate(a), np.concatenate(b)
+
+
+def _query_contained(polygons, LON, LAT):
+    """find all polygon-point pairs where the point is contained in the polygon"""
+
+    if len(polygons) == 0:
+        return np.array([], dtype=np.intp), np.array([], dtype=np.intp)
 
     # convert to points
     points = shapely.points(LON, LAT)
 
     tree = shapely.STRtree(points)
-    a, b = tree.query(polygons, predicate="contains")
+    return tree.query(polygons, predicate="contains")
+
+
+def _assign_contained(out, idx_poly, idx_point, numbers, *, as_3D):
+    """assign the polygon-point pairs of a query to the flat output mask (in-place)
+
+    For a 2D mask points contained in several polygons are assigned to the polygon
+    that comes last (i.e., as if the polygons were assigned one after another).
+    """
 
     if as_3D:
-        for i in range(len(numbers)):
-            out[i, b[a == i]] = True
-    else:
-        for i, number in enumerate(numbers):
-            out[b[a == i]] = number
+        out[idx_poly, idx_point] = True
+        return
 
-    return out.reshape(shape)
+    # sort by point and then polygon - keep the last polygon for each point
+    order = np.lexsort((idx_poly, idx_point))
+    idx_poly, idx_point = idx_poly[order], idx_point[order]
+
+    last = np.ones(idx_point.shape, dtype=bool)
+    last[:-1] = idx_point[1:] != idx_point[:-1]
+
+    out[idx_point[last]] = np.asarray(numbers)[idx_poly[last]]
 
 
 def _parse_input(lon, lat, coords, fill, numbers):
@@ -682,7 +835,8 @@ def _parse_input(lon, lat, coords, fill, numbers):
     if len(numbers) != n_coords:
         raise ValueError("`numbers` and `coords` must have the same length.")
 
-    if fill in numbers:
+    # NaN is never one of the numbers - avoid comparing against each of them
+    if not np.isnan(fill) and np.any(np.asarray(numbers) == fill):
         raise ValueError("The fill value should not be one of the region numbers.")
 
     return lon, lat
@@ -729,25 +883,25 @@ def _get_LON_LAT_shape(lon, lat, numbers, *, is_unstructured=False, as_3D=False)
 def _get_out(shape, fill, *, as_3D):
     # create flattened output variable
     if as_3D:
-        out = np.full(shape[:1] + (np.prod(shape[1:]).item(),), False, bool)
+        out = np.full((shape[0], math.prod(shape[1:])), False, bool)
     else:
-        out = np.full(np.prod(shape), fill, float)
+        out = np.full(math.prod(shape), fill, float)
 
     return out
 
 
-def _transform_from_latlon(lon, lat):
-    """perform an affine transformation to the latitude/longitude coordinates"""
+def _transform_from_latlon(lon, lat, *, offset=(0, 0)):
+    """affine transformation of the latitude/longitude coordinates, shifted by offset"""
 
     from affine import Affine
 
-    lat = np.asarray(lat)
-    lon = np.asarray(lon)
+    lon0, lon1 = np.asarray(lon[:2]) - offset[0]
+    lat0, lat1 = np.asarray(lat[:2]) - offset[1]
 
-    d_lon = lon[1] - lon[0]
-    d_lat = lat[1] - lat[0]
+    d_lon = lon1 - lon0
+    d_lat = lat1 - lat0
 
-    trans = Affine.translation(lon[0] - d_lon / 2, lat[0] - d_lat / 2)
+    trans = Affine.translation(lon0 - d_lon / 2, lat0 - d_lat / 2)
     scale = Affine.scale(d_lon, d_lat)
     return trans * scale
 
@@ -757,14 +911,18 @@ def _mask_rasterize_flip(
 ):
 
     split_point = _find_splitpoint(lon)
-    flipped_lon = np.hstack((lon[split_point:], lon[:split_point]))
+    flipped_lon = np.roll(lon, -split_point)
 
     mask = _mask_rasterize(
         flipped_lon, lat, polygons, numbers=numbers, as_3D=as_3D, **kwargs
     )
 
-    # revert the mask
-    return np.concatenate((mask[..., -split_point:], mask[..., :-split_point]), axis=-1)
+    # revert the mask: write both halves directly into the output
+    out = np.empty_like(mask)
+    out[..., :split_point] = mask[..., -split_point:]
+    out[..., split_point:] = mask[..., :-split_point]
+
+    return out
 
 
 def _mask_rasterize_split(
@@ -774,6 +932,16 @@ def _mask_rasterize_split(
     split_point = _find_splitpoint(lon)
     lon_l, lon_r = lon[:split_point], lon[split_point:]
 
+    if not as_3D:
+        # rasterize both halves directly into the output
+        out = np.empty((len(lat), len(lon)), dtype=float)
+        out_l, out_r = out[:, :split_point], out[:, split_point:]
+
+        _mask_rasterize(lon_l, lat, polygons, numbers, fill=fill, out=out_l, **kwargs)
+        _mask_rasterize(lon_r, lat, polygons, numbers, fill=fill, out=out_r, **kwargs)
+
+        return out
+
     mask_l = _mask_rasterize(
         lon_l, lat, polygons, numbers=numbers, as_3D=as_3D, **kwargs
     )
@@ -843,18 +1011,30 @@ def _mask_rasterize_internal(lon, lat, polygons, numbers, *, fill=np.nan, **kwar
     lon, lat = _parse_input(lon, lat, polygons, fill, numbers)
 
     # subtract a tiny offset: https://github.com/mapbox/rasterio/issues/1844
-    lon = lon - 1 * 10**-8
-    lat = lat - 1 * 10**-10
+    offset = (1 * 10**-8, 1 * 10**-10)
 
-    return _mask_rasterize_no_offset(lon, lat, polygons, numbers, fill=fill, **kwargs)
+    return _mask_rasterize_into(
+        lon, lat, polygons, numbers, fill=fill, offset=offset, **kwargs
+    )
 
 
-def _mask_rasterize_no_offset(
-    lon, lat, polygons, numbers, *, fill=np.nan, dtype=float, **kwargs
+def _mask_rasterize_into(
+    lon,
+    lat,
+    polygons,
+    numbers,
+    *,
+    fill=np.nan,
+    dtype=float,
+    out=None,
+    offset=(0, 0),
+    **kwargs,
 ) -> np.ndarray:
     """Rasterize a list of (geometry, fill_value) tuples onto the given coordinates.
 
-    This only works for regularly spaced 1D lat and lon arrays.
+    This only works for regularly spaced 1D lat and lon arrays. If ``out`` is given
+    the raster is written into it (it can be a view of a larger array). ``offset`` is
+    subtracted from lon and lat in the affine transform.
 
     for internal use: does not check valitity of input
     """
@@ -865,16 +1045,21 @@ def _mask_rasterize_no_offset(
 
     shapes = zip(polygons, numbers, strict=True)
 
-    transform = _transform_from_latlon(lon, lat)
+    transform = _transform_from_latlon(lon, lat, offset=offset)
     out_shape = (len(lat), len(lon))
 
     # can remove once https://github.com/rasterio/rasterio/issues/3043 is fixed
     dtype = dtype if dtype is None else np.dtype(dtype).name
 
+    if out is not None:
+        # rasterio does not apply fill to a passed array
+        out[...] = fill
+
     raster = features.rasterize(
         shapes,
         out_shape=out_shape,
         fill=fill,
+        out=out,
         transform=transform,
         dtype=dtype,
         **kwargs,
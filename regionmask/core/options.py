@@ -82,12 +82,15 @@ class set_options:
         self.old = {}
 
         for key, value in kwargs.items():
-            if key not in OPTIONS:
+            # every option has a validator: check and get it with one lookup
+            validator = _VALIDATORS.get(key)
+
+            if validator is None:
                 raise ValueError(
                     f"{key!r} is not in the set of valid options {set(OPTIONS)!r}"
                 )
 
-            _VALIDATORS[key](key, value)
+            validator(key, value)
 
             # mypy does not know that key must be a literal from _OPTIONS TypedDict
             self.old[key] = OPTIONS[key]  # type:ignore[literal-required]
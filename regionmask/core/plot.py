@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import functools
+import math
 import warnings
 from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
 import numpy as np
+import shapely
 
-from regionmask.core.utils import _flatten_polygons, flatten_3D_mask
+from regionmask.core.utils import flatten_3D_mask
 
 if TYPE_CHECKING:  # pragma: no cover
     from cartopy.mpl.geoaxes import GeoAxes
@@ -24,37 +27,50 @@ if TYPE_CHECKING:  # pragma: no cover
 
 def _polygons_coords(polygons):
 
-    coords = []
-    for p in polygons:
-        coords += [np.asarray(p.exterior.coords)[:, :2]] + [
-            np.asarray(i.coords)[:, :2] for i in p.interiors
-        ]
+    # exterior and interior rings of all polygons - in one call to GEOS
+    rings = shapely.get_rings(polygons)
+    coords, index = shapely.get_coordinates(rings, return_index=True)
 
-    return coords
+    if index.size == 0:
+        return []
+
+    # split the coordinates at the start of each ring
+    return np.split(coords, np.flatnonzero(np.diff(index)) + 1)
 
 
 def _get_tolerance(coords) -> float:
 
     mx = np.max(np.abs(coords))
-    return 1 if mx == 0 else max(10 ** (int(np.log10(mx)) - 2), 1)
+    return 1 if mx == 0 else max(10 ** (math.floor(math.log10(mx)) - 2), 1)
 
 
-def _draw_poly(ax, polygons, tolerance=None, **kwargs) -> None:
-    """
-    draw the outline of the regions
+def _segmentize_outlines(rings, tolerance=None):
+    """coordinates of the rings, segmentized according to tolerance"""
 
-    """
-
-    from matplotlib.collections import LineCollection
-
-    polygons = _flatten_polygons(polygons)
-    coords = _polygons_coords(polygons)
+    if not rings:
+        return rings
 
     if tolerance == "auto":
-        tolerance = _get_tolerance(np.concatenate(coords, 0))
+        # largest absolute coordinate of all rings - avoids concatenating them
+        tolerance = _get_tolerance(max(np.abs(c).max() for c in rings))
 
     if tolerance is not None:
-        coords = [segmentize(coord, tolerance) for coord in coords]
+        rings = _segmentize_rings(rings, tolerance)
+
+    # the arrays are cached and shared by all plots of the regions
+    for ring in rings:
+        ring.flags.writeable = False
+
+    return rings
+
+
+def _draw_poly(ax, coords, **kwargs) -> None:
+    """
+    draw the outline of the regions, given as list of the coordinates of their rings
+
+    """
+
+    from matplotlib.collections import LineCollection
 
     color = kwargs.pop("color", "0.1")
 
@@ -90,25 +106,96 @@ def segmentize(coords, tolerance):
     shapely.segmentize
     """
 
-    coords = np.asarray(coords)
-    dist = np.sqrt(np.sum((coords[1:] - coords[:-1]) ** 2, axis=1))
-    num = np.ceil(dist / tolerance).astype(int)
+    coords = np.asarray(coords, dtype=float)
+    diff = coords[1:] - coords[:-1]
+
+    # cheap upper bound of the segment lengths - common for lat/ lon coords
+    if _max_length_bound(diff) <= tolerance:
+        return coords
+
+    num = _n_subdivisions(diff, tolerance)
 
     if (num == 1).all():
         return coords
 
-    out = list()
-    for i in range(len(coords) - 1):
-        if num[i] > 1:
-            out.append(
-                np.linspace(coords[i, :], coords[i + 1, :], num=num[i], endpoint=False)
-            )
-        else:
-            out.append(coords[i : i + 1, :])
+    return _subdivide(coords, num)
+
+
+def _segmentize_rings(rings, tolerance):
+    """segmentize a list of rings at once - same as calling segmentize on each"""
+
+    if not rings:
+        return rings
+
+    coords = np.concatenate(rings, 0)
+    diff = coords[1:] - coords[:-1]
+
+    # index of the first vertex of each ring
+    start = np.cumsum([0] + [len(ring) for ring in rings[:-1]])
+
+    # the segments connecting two rings must not be subdivided
+    diff[start[1:] - 1] = 0
+
+    if _max_length_bound(diff) <= tolerance:
+        return rings
+
+    num = _n_subdivisions(diff, tolerance)
+    num[start[1:] - 1] = 1
+
+    if (num == 1).all():
+        return rings
 
-    out.append(coords[-1:, :])
+    out = _subdivide(coords, num)
 
-    return np.concatenate(out, 0)
+    # index of the first vertex of each ring in the segmentized coords
+    start = np.concatenate(([0], np.cumsum(np.maximum(num, 1))))[start]
+
+    return np.split(out, start[1:])
+
+
+def _max_length_bound(diff):
+    # the length of a segment is at most sqrt(2) * max(|dx|, |dy|)
+    return math.sqrt(2) * np.abs(diff).max(initial=0)
+
+
+def _n_subdivisions(diff, tolerance):
+
+    dist = np.sqrt(np.einsum("ij,ij->i", diff, diff))
+    return np.ceil(dist / tolerance).astype(int)
+
+
+def _subdivide(coords, num):
+
+    # segments of zero length are kept as one vertex
+    num = np.maximum(num, 1)
+
+    # index of the segment and of the new vertex within its segment
+    idx = np.repeat(np.arange(len(num)), num)
+    step = np.arange(idx.size) - np.repeat(np.cumsum(num) - num, num)
+
+    # evenly subdivide all segments at once (same as np.linspace(..., endpoint=False))
+    delta = (coords[1:] - coords[:-1]) / num[:, np.newaxis]
+    out = coords[idx] + step[:, np.newaxis] * delta[idx]
+
+    return np.concatenate((out, coords[-1:]), 0)
+
+
+@functools.lru_cache(maxsize=1)
+def _plate_carree():
+    # creating a CRS is not free - reuse the same (immutable) instance
+
+    import cartopy.crs as ccrs
+
+    return ccrs.PlateCarree()
+
+
+@functools.lru_cache(maxsize=8)
+def _natural_earth_feature(category, name, resolution):
+    # creating the feature initializes a PlateCarree CRS - reuse it for all plots
+
+    import cartopy.feature as cfeature
+
+    return cfeature.NaturalEarthFeature(category, name, resolution)
 
 
 def _check_unused_kws(add, kws, feature_name, kws_name):
@@ -214,7 +301,8 @@ def _plot(
         - None: draw original coordinates
         - float > 0: the maximum (euclidean) length of each line segment.
         - 'auto': The tolerance is automatically determined based on the log10 of the
-          largest absolute coordinate. Defaults to 1 for lat/ lon coordinates.
+          largest absolute coordinate. Defaults to 1 for lat/ lon coordinates. None
+          if the projection is ``PlateCarree()``, where lines remain straight.
 
     Returns
     -------
@@ -222,12 +310,9 @@ def _plot(
 
     """
 
-    import cartopy.crs as ccrs
     import cartopy.feature as cfeature
     from cartopy.mpl import geoaxes
 
-    NEF = cfeature.NaturalEarthFeature
-
     if label_multipolygon not in ["all", "largest"]:
         raise ValueError("'label_multipolygon' must be one of 'all' and 'largest'")
 
@@ -236,7 +321,7 @@ def _plot(
     _check_unused_kws(add_land, land_kws, "add_land", "land_kws")
 
     if projection is None:
-        projection = ccrs.PlateCarree()
+        projection = _plate_carree()
 
     if ax is not None and not isinstance(ax, geoaxes.GeoAxes):
         raise TypeError(
@@ -263,12 +348,12 @@ def _plot(
         coastline_kws = dict(color="0.4", lw=0.5)
 
     if add_ocean:
-        OCEAN = NEF("physical", "ocean", resolution)
+        OCEAN = _natural_earth_feature("physical", "ocean", resolution)
 
         ax.add_feature(OCEAN, **ocean_kws)
 
     if add_land:
-        LAND = NEF("physical", "land", resolution)
+        LAND = _natural_earth_feature("physical", "land", resolution)
 
         ax.add_feature(LAND, **land_kws)
 
@@ -331,9 +416,10 @@ def _plot_regions(
 
         - None: draw original coordinates
         - float > 0: the maximum (euclidean) length of each line segment.
-        - 'auto': None if a matplotlib axes is passed. If a cartopy GeoAxes is passed
-          the tolerance is automatically determined based on the log10 of the
-          largest absolute coordinate. Defaults to 1 for lat/ lon coordinates.
+        - 'auto': None if a matplotlib axes or a cartopy GeoAxes with a
+          ``PlateCarree()`` projection is passed. For other GeoAxes the tolerance is
+          automatically determined based on the log10 of the largest absolute
+          coordinate. Defaults to 1 for lat/ lon coordinates.
 
     Returns
     -------
@@ -345,7 +431,6 @@ def _plot_regions(
 
     is_geoaxes = False
     try:
-        import cartopy.crs as ccrs
         from cartopy.mpl import geoaxes
 
         is_geoaxes = isinstance(ax, geoaxes.GeoAxes)
@@ -361,7 +446,7 @@ def _plot_regions(
         ax = plt.gca()
 
     if is_geoaxes:
-        trans = ccrs.PlateCarree()
+        trans = _plate_carree()
     else:
         trans = ax.transData
 
@@ -371,43 +456,34 @@ def _plot_regions(
     if text_kws is None:
         text_kws = dict()
 
-    if tolerance == "auto" and not is_geoaxes:
+    # lines are straight if they are not transformed - no need to segmentize
+    projection = getattr(ax, "projection", None)
+    if tolerance == "auto" and (not is_geoaxes or projection == trans):
         tolerance = None
 
-    # draw the outlines
-    _draw_poly(ax, self.polygons, tolerance=tolerance, transform=trans, **line_kws)
+    # draw the outlines - the (segmentized) coordinates are cached on the regions
+    coords = self._outlines(tolerance)
+    _draw_poly(ax, coords, transform=trans, **line_kws)
 
     if add_label:
 
-        va = text_kws.pop("va", "center")
-        ha = text_kws.pop("ha", "center")
-        col = text_kws.pop("backgroundcolor", "0.85")
-        clip_on = text_kws.pop("clip_on", True)
-
-        for i in self.numbers:
-            r = self[i]
-            txt = str(getattr(r, label))
-
-            if label_multipolygon == "all":
-                polys = _flatten_polygons([r.polygon])
-                xy = [p.centroid.coords[0] for p in polys]
-            elif label_multipolygon == "largest":
-                xy = [r.centroid]
-
-            for x, y in xy:
-                t = ax.text(
-                    x,
-                    y,
-                    txt,
-                    transform=trans,
-                    va=va,
-                    ha=ha,
-                    backgroundcolor=col,
-                    clip_on=clip_on,
-                    **text_kws,
-                )
-
-                t.clipbox = ax.bbox
+        # merge instead of popping the defaults - must not modify the passed dict
+        defaults = dict(va="center", ha="center", backgroundcolor="0.85", clip_on=True)
+        kwargs = {"transform": trans, **defaults, **text_kws}
+
+        labels = [str(getattr(r, label)) for r in self.regions.values()]
+
+        # position of the labels & index of the region they belong to
+        if label_multipolygon == "all":
+            parts, index = shapely.get_parts(self.polygons, return_index=True)
+            xy = shapely.get_coordinates(shapely.centroid(parts))
+        elif label_multipolygon == "largest":
+            index = range(len(labels))
+            xy = self.centroids
+
+        for (x, y), i in zip(xy, index, strict=True):
+            t = ax.text(x, y, labels[i], **kwargs)
+            t.clipbox = ax.bbox
 
     return ax
 
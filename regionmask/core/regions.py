@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import copy
+import functools
 import warnings
 from collections.abc import Iterable
 from typing import Literal, overload
@@ -8,6 +8,7 @@ from typing import Literal, overload
 import geopandas as gp
 import numpy as np
 import pandas as pd
+import shapely
 import xarray as xr
 from shapely.geometry import MultiPolygon, Polygon
 
@@ -18,8 +19,14 @@ from regionmask.core.mask import (
     _mask_3D,
     _mask_3D_frac_approx,
 )
-from regionmask.core.plot import _plot, _plot_regions
+from regionmask.core.plot import (
+    _plot,
+    _plot_regions,
+    _polygons_coords,
+    _segmentize_outlines,
+)
 from regionmask.core.utils import (
+    _flatten_polygons,
     _is_180,
     _is_numeric,
     _maybe_to_dict,
@@ -27,6 +34,24 @@ from regionmask.core.utils import (
     _total_bounds,
 )
 
+# maximum number of tolerances for which the outlines are cached
+_MAX_CACHED_OUTLINES = 4
+
+
+def _cached_from_regions(func):
+    """cache an attribute derived from the regions - reset when they are changed"""
+
+    key = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(self):
+        cache = self._cache
+        if key not in cache:
+            cache[key] = func(self)
+        return cache[key]
+
+    return property(wrapper)
+
 
 class Regions:
     """
@@ -147,11 +172,29 @@ class Regions:
         names = _sanitize_names_abbrevs(numbers, names, "Region")
         abbrevs = _sanitize_names_abbrevs(numbers, abbrevs, "r")
 
+        # create the polygons of outlines given as coordinates in one go
+        coords = {
+            n: _sanitize_outline(outlines[n])
+            for n in numbers
+            if not isinstance(outlines[n], Polygon | MultiPolygon)
+        }
+        polygon_of = dict(
+            zip(coords, _polygons_from_coords(list(coords.values())), strict=True)
+        )
+
+        # pass on the coordinates the polygons were created from
         regions = {
-            n: _OneRegion(n, names[n], abbrevs[n], outlines[n]) for n in sorted(numbers)
+            n: _OneRegion(
+                n,
+                names[n],
+                abbrevs[n],
+                polygon_of.get(n, outlines[n]),
+                coords=coords.get(n),
+            )
+            for n in sorted(numbers)
         }
 
-        self.regions: dict[int, _OneRegion] = regions
+        self.regions = regions
         self.name: str = name
         self.source: str | None = source
         self.overlap: bool | None = overlap
@@ -183,18 +226,50 @@ class Regions:
 
         """
 
+        # fast path for region numbers
+        if isinstance(key, int | np.integer) and key in self._regions:
+            return self._regions[key]
+
         key = self.map_keys(key)
-        if np.ndim(key) == 0:
-            return self.regions[key]
+        # map_keys returns a list for several keys
+        if not isinstance(key, list):
+            return self._regions[key]
         else:
             # subsample the regions
-            regions = {k: self.regions[k] for k in key}
-            new_self = copy.copy(self)  # shallow copy
+            regions = {k: self._regions[k] for k in key}
+            # create the subset directly - cheaper than copy.copy and does not
+            # carry over the cached attributes
+            new_self = type(self).__new__(type(self))
             new_self.regions = regions
+            new_self.name = self.name
+            new_self.source = self.source
+            new_self.overlap = self.overlap
             return new_self
 
     def __len__(self) -> int:
-        return len(self.regions)
+        return len(self._regions)
+
+    @property
+    def regions(self) -> dict[int, _OneRegion]:
+        """dictionary mapping the region numbers to the individual regions"""
+        return self._regions
+
+    @regions.setter
+    def regions(self, value: dict[int, _OneRegion]) -> None:
+        # setting the regions resets the cache (changing the dict in-place does not)
+        self._regions = value
+        self._reset_cache()
+
+    def _reset_cache(self) -> None:
+        self._cached: dict = {}
+        self._cached_at = _OneRegion._n_changes
+
+    @property
+    def _cache(self) -> dict:
+        """attributes derived from the regions (reset if any region was changed)"""
+        if self._cached_at != _OneRegion._n_changes:
+            self._reset_cache()
+        return self._cached
 
     def map_keys(self, key) -> int | list[int]:
         """map from names and abbrevs of the regions to numbers
@@ -217,19 +292,18 @@ class Regions:
 
         _region_ids = self._region_ids
 
-        # a single key
-        if np.ndim(key) == 0:
+        # a single key - avoid np.ndim, which converts lists to an array
+        if isinstance(key, str) or not isinstance(key, Iterable):
             key = _region_ids[key]
         # a list of keys
         else:
-            key = [_region_ids[k] for k in key]
-            # make sure they are unique
-            key = np.unique(key).tolist()
+            # make sure they are unique and sorted - avoid np.unique for short lists
+            key = sorted({_region_ids[k] for k in key})
 
         return key
 
     def __iter__(self):
-        yield from self.regions.values()
+        yield from self._regions.values()
 
     @property
     def region_ids(self):
@@ -241,36 +315,47 @@ class Regions:
             stacklevel=2,
         )
 
-        return self._region_ids
+        return dict(self._region_ids)
 
-    @property
+    @_cached_from_regions
     def _region_ids(self) -> dict[str | int, int]:
         """dictionary that maps all names and abbrevs to the region number"""
 
-        # collect data
-        abbrevs = self.abbrevs
-        names = self.names
-        numbers = self.numbers
-        # combine data and make a mapping
-        keys: list[int | str] = abbrevs + names + numbers
-        all_comb = zip(keys, numbers * 3)
-        region_ids = {key: value for key, value in all_comb}
+        numbers = self._numbers
+
+        # add names after abbrevs and numbers last - later keys take precedence
+        region_ids: dict[str | int, int] = dict(zip(self._abbrevs, numbers))
+        region_ids.update(zip(self._names, numbers))
+        region_ids.update(zip(numbers, numbers))
+
         return region_ids
 
     @property
     def abbrevs(self) -> list[str]:
         """list of abbreviations of the regions"""
-        return [r.abbrev for r in self.regions.values()]
+        return list(self._abbrevs)
+
+    @_cached_from_regions
+    def _abbrevs(self) -> tuple[str, ...]:
+        return tuple(r.abbrev for r in self._regions.values())
 
     @property
     def names(self) -> list[str]:
         """list of names of the regions"""
-        return [r.name for r in self.regions.values()]
+        return list(self._names)
+
+    @_cached_from_regions
+    def _names(self) -> tuple[str, ...]:
+        return tuple(r.name for r in self._regions.values())
 
     @property
     def numbers(self) -> list[int]:
         """list of the numbers of the regions"""
-        return [r.number for r in self.regions.values()]
+        return list(self._numbers)
+
+    @_cached_from_regions
+    def _numbers(self) -> tuple[int, ...]:
+        return tuple(r.number for r in self._regions.values())
 
     @property
     def coords(self):
@@ -283,22 +368,35 @@ class Regions:
             stacklevel=2,
         )
 
-        return [r.coords for r in self.regions.values()]
+        return [r.coords for r in self._regions.values()]
 
     @property
     def polygons(self) -> list[Polygon | MultiPolygon]:
         """list of shapely Polygon/ MultiPolygon of the regions"""
-        return [r.polygon for r in self.regions.values()]
+        return list(self._polygons)
+
+    @_cached_from_regions
+    def _polygons(self) -> tuple[Polygon | MultiPolygon, ...]:
+        return tuple(r.polygon for r in self._regions.values())
 
     @property
     def centroids(self) -> list[np.ndarray]:
         """list of the center of mass of the regions"""
-        return [r.centroid for r in self.regions.values()]
+        return list(self._centroids)
+
+    @_cached_from_regions
+    def _centroids(self) -> tuple[np.ndarray, ...]:
+        return tuple(r.centroid for r in self._regions.values())
 
     @property
     def bounds(self) -> list[tuple[float, float, float, float]]:
         """list of the bounds of the regions (min_lon, min_lat, max_lon, max_lat)"""
-        return [r.bounds for r in self.regions.values()]
+        return list(self._bounds)
+
+    @_cached_from_regions
+    def _bounds(self) -> tuple[tuple[float, float, float, float], ...]:
+        # get the bounds of all regions at once
+        return tuple(map(tuple, shapely.bounds(self.polygons).tolist()))
 
     @property
     def bounds_global(self) -> np.ndarray:
@@ -424,12 +522,11 @@ class Regions:
             use_cf=use_cf,
         )
 
-        numbers = mask_3D.region.values
-        abbrevs = self[numbers].abbrevs
-        names = self[numbers].names
+        # subset the regions only once
+        regions = self[mask_3D.region.values]
 
         mask_3D = mask_3D.assign_coords(
-            abbrevs=("region", abbrevs), names=("region", names)
+            abbrevs=("region", regions.abbrevs), names=("region", regions.names)
         )
 
         return mask_3D
@@ -457,12 +554,11 @@ class Regions:
             use_cf=use_cf,
         )
 
-        numbers = mask_3D.region.values
-        abbrevs = self[numbers].abbrevs
-        names = self[numbers].names
+        # subset the regions only once
+        regions = self[mask_3D.region.values]
 
         mask_3D = mask_3D.assign_coords(
-            abbrevs=("region", abbrevs), names=("region", names)
+            abbrevs=("region", regions.abbrevs), names=("region", regions.names)
         )
 
         return mask_3D
@@ -600,10 +696,64 @@ class Regions:
     plot = _plot
     plot_regions = _plot_regions
 
+    @_cached_from_regions
+    def _outlines_cache(self) -> dict:
+        return {}
+
+    def _outlines(self, tolerance=None) -> list[np.ndarray]:
+        """coordinates of the rings of all regions for plotting (cached per tolerance)"""
+
+        cache = self._outlines_cache
+        if tolerance not in cache:
+            # only keep the outlines for a few tolerances (drop the oldest)
+            if len(cache) >= _MAX_CACHED_OUTLINES:
+                del cache[next(iter(cache))]
+
+            rings = [c for r in self._regions.values() for c in r._ring_coords]
+            cache[tolerance] = _segmentize_outlines(rings, tolerance)
+        return cache[tolerance]
+
 
 # =============================================================================
 
 
+def _sanitize_outline(outline) -> np.ndarray:
+
+    outline = np.asarray(outline)
+
+    if outline.ndim != 2:
+        raise ValueError(
+            "Outline must be 2D. Did you pass a single region and need to wrap "
+            "it in a list?"
+        )
+
+    if outline.shape[1] != 2:
+        raise ValueError("Outline must have Nx2 elements")
+
+    return outline
+
+
+def _polygons_from_coords(coords: list[np.ndarray]) -> list[Polygon]:
+    """create Polygons from a list of Nx2 coordinate arrays with one call to shapely"""
+
+    # empty outlines add no index - create their (empty) polygons separately
+    polygons = [Polygon() for _ in coords]
+    non_empty = [i for i, c in enumerate(coords) if len(c)]
+
+    if not non_empty:
+        return polygons
+
+    sizes = [len(coords[i]) for i in non_empty]
+    indices = np.repeat(np.arange(len(non_empty)), sizes)
+    xy = np.concatenate([coords[i] for i in non_empty], 0)
+    rings = shapely.linearrings(xy, indices=indices)
+
+    for i, polygon in zip(non_empty, shapely.polygons(rings), strict=True):
+        polygons[i] = polygon
+
+    return polygons
+
+
 class _OneRegion:
     """a single Region, used as member of ``Regions``
 
@@ -618,6 +768,9 @@ class _OneRegion:
     outline : Nx2 array of vertices, Polygon or MultiPolygon
         Coordinates/ outline of the region as shapely Polygon/
         MultiPolygon or list.
+    coords : Nx2 array of vertices, optional
+        Coordinates the Polygon was created from. Only used if ``outline``
+        is a Polygon or MultiPolygon.
 
     Examples
     --------
@@ -637,31 +790,22 @@ class _OneRegion:
     <regionmask._OneRegion: Unit Square (USq / 1)>
     """
 
-    def __init__(self, number, name, abbrev, outline):
+    def __init__(self, number, name, abbrev, outline, *, coords=None):
 
-        self.number = number
-        self.name = name
-        self.abbrev = abbrev
+        self._number = number
+        self._name = name
+        self._abbrev = abbrev
         self._centroid = None
         self._bounds = None
+        self._rings = None
 
         if isinstance(outline, Polygon | MultiPolygon):
-            self.polygon = outline
-            self._coords = None
+            self._polygon = outline
+            self._coords = coords
         else:
+            outline = _sanitize_outline(outline)
 
-            outline = np.asarray(outline)
-
-            if outline.ndim != 2:
-                raise ValueError(
-                    "Outline must be 2D. Did you pass a single region and need to wrap "
-                    "it in a list?"
-                )
-
-            if outline.shape[1] != 2:
-                raise ValueError("Outline must have Nx2 elements")
-
-            self.polygon = Polygon(outline)
+            self._polygon = Polygon(outline)
             self._coords = outline
 
     def __repr__(self):
@@ -669,6 +813,55 @@ class _OneRegion:
         klass = type(self).__name__
         return f"<regionmask.{klass}: {self.name} ({self.abbrev} / {self.number})>"
 
+    # ``Regions`` caches the attributes derived from the regions - count the changes
+    # to the regions so it can reset its cache
+    _n_changes = 0
+
+    @property
+    def number(self):
+        """number of the region"""
+        return self._number
+
+    @number.setter
+    def number(self, value):
+        self._number = value
+        _OneRegion._n_changes += 1
+
+    @property
+    def name(self):
+        """long name of the region"""
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+        _OneRegion._n_changes += 1
+
+    @property
+    def abbrev(self):
+        """abbreviation of the region"""
+        return self._abbrev
+
+    @abbrev.setter
+    def abbrev(self, value):
+        self._abbrev = value
+        _OneRegion._n_changes += 1
+
+    @property
+    def polygon(self):
+        """shapely Polygon/ MultiPolygon of the region"""
+        return self._polygon
+
+    @polygon.setter
+    def polygon(self, value):
+        self._polygon = value
+        # reset the attributes derived from the polygon
+        self._centroid = None
+        self._bounds = None
+        self._rings = None
+        self._coords = None
+        _OneRegion._n_changes += 1
+
     @property
     def centroid(self):
 
@@ -677,11 +870,9 @@ class _OneRegion:
             poly = self.polygon
             if isinstance(poly, MultiPolygon):
                 # find the polygon with the largest area and assign as centroid
-                area = 0
-                for p in poly.geoms:
-                    if p.area > area:
-                        centroid = np.array(p.centroid.coords).squeeze()
-                        area = p.area
+                parts = shapely.get_parts(poly)
+                largest = parts[np.argmax(shapely.area(parts))]
+                centroid = np.array(largest.centroid.coords).squeeze()
 
                 # another possibility; errors on self-intersecting polygon
                 # centroid = np.array(poly.representative_point().coords).squeeze()
@@ -701,13 +892,12 @@ class _OneRegion:
             if isinstance(self.polygon, Polygon):
                 coords_ = np.array(self.polygon.exterior.coords)
             else:
-                polys = self.polygon.geoms
+                exteriors = shapely.get_exterior_ring(shapely.get_parts(self.polygon))
+                coords, index = shapely.get_coordinates(exteriors, return_index=True)
 
                 # separate the single polygons with nans
-                nan = np.full((1, 2), np.nan)
-                coords = [c for poly in polys for c in (poly.exterior.coords, nan)]
-                # remove the last nan and stack
-                coords_ = np.vstack(coords[:-1])
+                split = np.flatnonzero(np.diff(index)) + 1
+                coords_ = np.insert(coords, split, np.nan, axis=0)
 
             self._coords = coords_
 
@@ -721,3 +911,14 @@ class _OneRegion:
         if self._bounds is None:
             self._bounds = self.polygon.bounds
         return self._bounds
+
+    @property
+    def _ring_coords(self):
+        """list of the coordinates of all exterior and interior rings (for plotting)"""
+        if self._rings is None:
+            rings = _polygons_coords(_flatten_polygons([self.polygon]))
+            # the arrays are shared by all plots of the region
+            for ring in rings:
+                ring.flags.writeable = False
+            self._rings = rings
+        return self._rings
@@ -16,23 +16,31 @@ def _total_bounds(polygons) -> np.ndarray:
 
 def _flatten_polygons(polygons, error="raise") -> list[shapely.Polygon]:
 
-    from shapely.geometry import MultiPolygon, Polygon
-
     if error not in ("raise", "skip"):
         raise ValueError("'error' must be one of 'raise' and 'skip'")
 
-    polys = []
-    for p in polygons:
-        if isinstance(p, MultiPolygon):
-            polys += list(p.geoms)
-        elif isinstance(p, Polygon):
-            polys += [p]
-        else:
-            if error == "raise":
-                msg = f"Expected 'Polygon' or 'MultiPolygon', found {type(p)}"
-                raise TypeError(msg)
+    polygons = np.asarray(polygons, dtype=object)
+
+    # get_type_id raises for objects that are not geometries - assign them -1
+    is_geometry = shapely.is_geometry(polygons)
+    type_id = np.full(polygons.shape, -1)
+    type_id[is_geometry] = shapely.get_type_id(polygons[is_geometry])
+
+    is_single = type_id == shapely.GeometryType.POLYGON
+    is_multi = type_id == shapely.GeometryType.MULTIPOLYGON
+    is_polygon = is_single | is_multi
 
-    return polys
+    if error == "raise" and not is_polygon.all():
+        p = polygons[~is_polygon][0]
+        msg = f"Expected 'Polygon' or 'MultiPolygon', found {type(p)}"
+        raise TypeError(msg)
+
+    # nothing to split - return the polygons themselves
+    if not is_multi.any():
+        return list(polygons[is_single])
+
+    # split the MultiPolygons into their parts, in one call to GEOS
+    return list(shapely.get_parts(polygons[is_polygon]))
 
 
 def _maybe_to_dict(keys, values) -> dict:
@@ -66,14 +74,25 @@ def _sanitize_names_abbrevs(numbers, values, default) -> dict[int, str]:
 
 def _wrapAngle360(lon: ArrayLike) -> np.ndarray:
     """wrap angle to `[0, 360[`."""
-    lon = np.array(lon)
+    lon = np.asarray(lon)
+
+    # avoid allocating a new array if there is nothing to wrap
+    if ((0 <= lon) & (lon < 360)).all():
+        return lon
+
     return np.mod(lon, 360)
 
 
 def _wrapAngle180(lon: ArrayLike) -> np.ndarray:
     """wrap angle to `[-180, 180[`."""
-    lon = np.array(lon)
+    lon = np.asarray(lon)
     sel = (lon < -180) | (180 <= lon)
+
+    # avoid the copy if there is nothing to wrap
+    if not sel.any():
+        return lon
+
+    lon = lon.copy()
     lon[sel] = _wrapAngle360(lon[sel] + 180) - 180
     return lon
 
@@ -91,7 +110,8 @@ def _wrapAngle(
 
     lon_ = [lon] if np.isscalar(lon) else lon
 
-    lon_ = np.array(lon_)
+    # no copy: _wrapAngle180 and _wrapAngle360 only copy if necessary
+    lon_ = np.asarray(lon_)
 
     if wrap_lon is True:
         mn, mx = np.nanmin(lon_), np.nanmax(lon_)
@@ -283,17 +303,20 @@ def flatten_3D_mask(mask_3D: xr.DataArray) -> xr.DataArray:
     if "region" not in mask_3D.coords:
         raise ValueError("``mask_3D`` must contain the dimension 'region'")
 
-    if (mask_3D.sum("region") > 1).any():
+    # number of regions each gridpoint belongs to
+    n_regions = mask_3D.sum("region")
+
+    if (n_regions > 1).any():
         warnings.warn(
             "Found overlapping regions which cannot correctly be reduced to a 2D mask",
             RuntimeWarning,
         )
 
-    # flatten the mask
-    mask_2D = (mask_3D * mask_3D.region).sum("region")
+    # flatten the mask - xr.dot multiplies and sums in one step (einsum)
+    mask_2D = xr.dot(mask_3D, mask_3D.region).rename(None)
 
     # mask all gridpoints not belonging to any region
-    return mask_2D.where(mask_3D.any("region"))
+    return mask_2D.where(n_regions > 0)
 
 
 def _snap_polygon(polygon, to, atol, xy_col):
@@ -38,6 +38,16 @@ def test_polygon_input() -> None:
     assert r.polygon == outl_poly
 
 
+def test_polygon_input_coords() -> None:
+
+    # the coords the polygon was created from (not closed) are kept
+    outl = np.array([[0, 0], [0, 1], [1, 1.0], [1, 0]])
+
+    r = _OneRegion(1, "Unit Square", "USq", Polygon(outl), coords=outl)
+
+    assert r.coords is outl
+
+
 def test_multi_polygon_input() -> None:
 
     # polygon closes open paths
@@ -84,6 +94,26 @@ def test_bounds() -> None:
     assert np.allclose(r.bounds, (0, -1, 2, 1))
 
 
+def test_ring_coords() -> None:
+
+    exterior = ((0, 0), (0, 3), (3, 3), (3, 0), (0, 0))
+    interior = ((1, 1), (1, 2), (2, 2), (2, 1), (1, 1))
+    other = ((5, 5), (5, 6), (6, 6), (6, 5), (5, 5))
+
+    poly = MultiPolygon([Polygon(exterior, [interior]), Polygon(other)])
+    r = _OneRegion(1, "Unit Square", "USq", poly)
+
+    result = r._ring_coords
+    assert len(result) == 3
+    np.testing.assert_equal(result[0], exterior)
+    np.testing.assert_equal(result[1], interior)
+    np.testing.assert_equal(result[2], other)
+
+    # cached and read-only
+    assert r._ring_coords is result
+    assert not result[0].flags.writeable
+
+
 def test_wrong_region_outlines() -> None:
 
     outl1 = (((0, 0), (0, 1)), ((1, 1.0), (1, 0)))
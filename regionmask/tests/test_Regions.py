@@ -59,6 +59,44 @@ def test_regions_single_region() -> None:
             Regions(o)
 
 
+def test_regions_mixed_outlines() -> None:
+
+    outl3 = np.array([[0, 2], [0, 3], [1, 3], [1, 2], [0, 2]])
+    r = Regions([outl1, poly2, outl3])
+
+    assert r.polygons[0].equals_exact(poly1, 0)
+    assert r.polygons[1] is poly2
+    assert r.polygons[2].equals_exact(Polygon(outl3), 0)
+
+    # the coords are the outlines passed
+    np.testing.assert_equal(r[0].coords, outl1)
+    np.testing.assert_equal(r[2].coords, outl3)
+
+
+@pytest.mark.parametrize("position", [0, 1, 2])
+def test_regions_empty_outline(position) -> None:
+
+    outlines: list = [outl1, outl2]
+    outlines.insert(position, np.zeros((0, 2)))
+
+    r = Regions(outlines)
+
+    assert len(r) == 3
+    assert r.polygons[position].is_empty
+
+    expected = [poly1, poly2]
+    polygons = [p for i, p in enumerate(r.polygons) if i != position]
+    for polygon, exp in zip(polygons, expected, strict=True):
+        assert polygon.equals_exact(exp, 0)
+
+
+@pytest.mark.parametrize("outline", [[(0, 0), (1, 1)], [[[0, 0], [1, 1], [1, 0]]]])
+def test_regions_wrong_outline(outline) -> None:
+
+    with pytest.raises(ValueError):
+        Regions([outl1, outline])
+
+
 @pytest.mark.parametrize("test_regions", all_test_regions)
 def test_len(test_regions) -> None:
     assert len(test_regions) == 2
@@ -219,6 +257,16 @@ def test_subset_to_OneRegion(test_regions, number) -> None:
     assert s1.number == number
     assert s1.abbrev == "uSq1"
 
+    s1 = test_regions[np.int64(number)]
+    assert isinstance(s1, _OneRegion)
+    assert s1.number == number
+
+
+def test_subset_to_OneRegion_missing_number() -> None:
+
+    with pytest.raises(KeyError):
+        test_regions1[5]
+
 
 @pytest.mark.parametrize("test_region", all_test_regions)
 def test_Regions_iter(test_region) -> None:
@@ -237,6 +285,70 @@ def test_subset_to_Regions(test_regions, number) -> None:
     assert s1.abbrevs == ["uSq1"]
 
 
+def test_subset_resets_cache() -> None:
+
+    r = Regions([outl1] * 5)
+
+    # populate the cache on the parent
+    assert r.numbers == [0, 1, 2, 3, 4]
+    assert r._region_ids["r4"] == 4
+
+    subset = r[[1, 3]]
+    assert subset.numbers == [1, 3]
+    assert subset.abbrevs == ["r1", "r3"]
+    assert len(subset.polygons) == 2
+    assert "r4" not in subset._region_ids
+
+    # the parent is unchanged
+    assert r.numbers == [0, 1, 2, 3, 4]
+
+
+def test_cached_list_not_shared() -> None:
+
+    r = Regions([outl1] * 2)
+
+    numbers = r.numbers
+    numbers.append(5)
+    assert r.numbers == [0, 1]
+
+
+def test_set_regions_resets_cache() -> None:
+
+    r = Regions([outl1] * 2)
+    assert r.numbers == [0, 1]
+
+    r.regions = {1: r.regions[1]}
+    assert r.numbers == [1]
+    assert r.map_keys("r1") == 1
+
+
+@pytest.mark.parametrize("attr", ["number", "name", "abbrev", "polygon"])
+def test_set_OneRegion_attr_resets_cache(attr) -> None:
+
+    r = Regions([outl1, outl2])
+    subset = r[[0, 1]]
+
+    # populate the caches
+    for regions in (r, subset):
+        assert regions.numbers == [0, 1]
+        assert regions.names == ["Region0", "Region1"]
+        assert regions.abbrevs == ["r0", "r1"]
+        assert regions.polygons[0].equals(poly1)
+        assert regions.centroids[0].tolist() == [0.5, 0.5]
+
+    value = {"number": 5, "name": "new", "abbrev": "n", "polygon": poly2}[attr]
+    setattr(r[0], attr, value)
+
+    # the cache of all Regions containing the region is reset
+    for regions in (r, subset):
+        assert getattr(regions, attr + "s")[0] == value
+        assert regions[1].name == "Region1"
+
+    if attr == "polygon":
+        assert r.centroids[0].tolist() == [0.5, 1.5]
+        assert r.bounds[0] == poly2.bounds
+
+
 @pytest.mark.parametrize("numbers", [None, [1, 2]])
 @pytest.mark.parametrize("names", [None, "names", names])
 @pytest.mark.parametrize("abbrevs", [None, "abbrevs", abbrevs])
@@ -360,6 +472,17 @@ def test_overlap_getitem(overlap) -> None:
     assert r_select.overlap is overlap
 
 
+def test_getitem_keeps_attributes() -> None:
+
+    r = Regions(3 * [outl1], name="name", source="source")
+    r_select = r[[0, 2]]
+
+    assert type(r_select) is Regions
+    assert r_select.name == "name"
+    assert r_select.source == "source"
+    assert r_select.numbers == [0, 2]
+
+
 def _check_dataframe(df, r):
 
     assert (df.index == r.numbers).all()
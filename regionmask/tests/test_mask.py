@@ -3,17 +3,23 @@ from collections.abc import Callable
 
 import numpy as np
 import pytest
+import shapely
 import xarray as xr
 from affine import Affine
-from shapely.geometry import Polygon, box
+from shapely.geometry import MultiPolygon, Polygon, box
 
 from regionmask import Regions
 from regionmask.core.mask import (
+    _assign_contained,
     _determine_method,
     _inject_mask_docstring,
+    _is_box,
+    _mask_edgepoints_shapely,
     _mask_rasterize,
-    _mask_rasterize_no_offset,
+    _mask_rasterize_into,
     _mask_shapely,
+    _query_boxes,
+    _query_contained,
     _transform_from_latlon,
 )
 from regionmask.core.utils import _wrapAngle, create_lon_lat_dataarray_from_bounds
@@ -75,6 +81,124 @@ def test_mask_wrong_number_fill(func) -> None:
         func(dummy_ds.lon, dummy_ds.lat, dummy_region.polygons, numbers=[5])
 
 
+def test_assign_contained() -> None:
+
+    # polygon indices are not sorted & point 1 is contained in polygons 0 and 2
+    idx_poly = np.array([2, 0, 0, 1])
+    idx_point = np.array([1, 1, 0, 3])
+
+    out = np.full(4, np.nan)
+    _assign_contained(out, idx_poly, idx_point, [5, 6, 7], as_3D=False)
+    np.testing.assert_equal(out, [5, 7, np.nan, 6])
+
+    out = np.full((3, 4), False)
+    _assign_contained(out, idx_poly, idx_point, [5, 6, 7], as_3D=True)
+    expected = [[1, 1, 0, 0], [0, 0, 0, 1], [0, 1, 0, 0]]
+    np.testing.assert_equal(out, np.array(expected, dtype=bool))
+
+    # no point is contained in any polygon
+    out = np.full(4, np.nan)
+    empty = np.array([], dtype=int)
+    _assign_contained(out, empty, empty, [5, 6, 7], as_3D=False)
+    np.testing.assert_equal(out, np.full(4, np.nan))
+
+
+@pytest.mark.parametrize("as_3D", [True, False])
+def test_mask_shapely_boxes_and_polygons(as_3D) -> None:
+
+    # rectangles are masked without a point-in-polygon test
+    lon = np.arange(-10, 11, 1.0)
+    lat = np.arange(-5, 6, 1.0)
+
+    polygons = [
+        box(-8, -4, -2, 3),
+        # a rectangle with an additional vertex (uses the point-in-polygon test)
+        Polygon([(0, 0), (5, 0), (10, 0), (10, 5), (0, 5)]),
+        Polygon([(-3, -5), (1, -5), (-3, 1)]),
+        box(-3, -2, 6, 2),
+    ]
+    numbers = [0, 1, 2, 3]
+
+    result = _mask_shapely(lon, lat, polygons, numbers, as_3D=as_3D)
+    expected = _mask_rasterize(lon, lat, polygons, numbers, as_3D=as_3D)
+
+    np.testing.assert_equal(result, expected)
+
+
+@pytest.mark.parametrize("as_3D", [True, False])
+@pytest.mark.parametrize("ndim", [1, 2])
+def test_mask_shapely_many_boxes(ndim, as_3D) -> None:
+
+    # every gridpoint lies in exactly one of the boxes
+    lon = np.arange(-9.5, 10, 1.0)
+    lat = np.arange(-4.5, 5, 1.0)
+
+    polygons = [box(x, y, x + 1, y + 1) for y in range(-5, 5) for x in range(-10, 10)]
+    numbers = list(range(len(polygons)))
+
+    if ndim == 2:
+        lon, lat = np.meshgrid(lon, lat)
+
+    result = _mask_shapely(lon, lat, polygons, numbers, as_3D=as_3D)
+
+    expected = np.arange(len(polygons)).reshape(10, 20)
+    if as_3D:
+        expected = expected == np.arange(len(polygons)).reshape(-1, 1, 1)
+
+    np.testing.assert_equal(result, expected)
+
+
+def test_query_boxes() -> None:
+
+    lon = np.arange(-9.75, 10, 0.5)
+    lat = np.arange(-4.75, 5, 0.5)
+    LON, LAT = (c.ravel() for c in np.meshgrid(lon, lat))
+
+    # squares, lat bands and lon bands (checked along lon or lat)
+    polygons = [box(x, y, x + 1, y + 1) for y in range(-5, 5) for x in range(-10, 10)]
+    polygons += [box(-10, y, 10, y + 2) for y in range(-5, 5, 2)]
+    polygons += [box(x, -5, x + 2, 5) for x in range(-10, 10, 2)]
+    polygons += [box(20, 20, 21, 21)]
+
+    bounds = shapely.bounds(polygons)
+    a, b = _query_boxes(bounds, LON, LAT)
+    a_expected, b_expected = _query_contained(np.array(polygons), LON, LAT)
+
+    result = sorted(zip(a.tolist(), b.tolist()))
+    expected = sorted(zip(a_expected.tolist(), b_expected.tolist()))
+
+    assert result == expected
+
+    a, b = _query_boxes(np.empty((0, 4)), LON, LAT)
+    assert a.size == b.size == 0
+
+
+def test_is_box() -> None:
+
+    polygons = np.array(
+        [
+            box(0, 0, 1, 1),
+            Polygon([(0, 0), (1, 0), (1, 1), (0, 1)]),
+            Polygon([(0, 0), (1, 0), (1, 1), (0, 1)]).reverse(),
+            # rectangle with an additional vertex - not detected (but correct)
+            Polygon([(0, 0), (0.5, 0), (1, 0), (1, 1), (0, 1)]),
+            Polygon([(0, 0), (1, 0), (1, 2), (0, 1)]),
+            box(0, 0, 3, 3).difference(box(1, 1, 2, 2)),
+            # self-intersecting "bowtie" and degenerate polygons with 5 coords
+            Polygon([(0, 0), (1, 1), (0, 1), (1, 0)]),
+            Polygon([(0, 0), (1, 0), (0, 0), (0, 1)]),
+            Polygon([(0, 0), (1, 0), (1, 0), (0, 0)]),
+            Polygon([(0, 0), (1, 0), (1, 1), (1, 0)]),
+            MultiPolygon([box(0, 0, 1, 2)]),
+        ]
+    )
+
+    result = _is_box(polygons, shapely.bounds(polygons))
+    expected = [True, True, True, False, False, False, False, False, False, False]
+    expected += [True]
+    np.testing.assert_equal(result, expected)
+
+
 @pytest.mark.parametrize("method", MASK_METHODS)
 def test_mask(method) -> None:
 
@@ -535,6 +659,18 @@ def test_transform_from_latlon(lon_start, dlon, lat_start, dlat) -> None:
     assert np.allclose(np.array(r), expected)
 
 
+def test_transform_from_latlon_offset() -> None:
+
+    lon = np.arange(-5, 20, 2.5)
+    lat = np.arange(0, 20, 1.5)
+    offset = (1 * 10**-8, 1 * 10**-10)
+
+    result = _transform_from_latlon(lon, lat, offset=offset)
+    expected = _transform_from_latlon(lon - offset[0], lat - offset[1])
+
+    assert result == expected
+
+
 @pytest.mark.parametrize("a, b", [(0, 1), (4, 5)])
 @pytest.mark.parametrize("fill", [np.nan, 3])
 def test_rasterize(a, b, fill) -> None:
@@ -757,7 +893,7 @@ def test_rasterize_edge() -> None:
     lat = ds_US_180.lat
 
     expected = expected_mask_edge(ds_US_180, is_360=False)
-    result = _mask_rasterize_no_offset(lon, lat, r_US_180_ccw.polygons, numbers=[0])
+    result = _mask_rasterize_into(lon, lat, r_US_180_ccw.polygons, numbers=[0])
 
     np.testing.assert_equal(result, expected)
 
@@ -789,10 +925,12 @@ def test_deg45_rasterize_offset_equal(regions) -> None:
     lon = ds_for_45_deg.lon
     lat = ds_for_45_deg.lat
 
-    result_no_offset = _mask_rasterize_no_offset(lon, lat, polygons, numbers=[0])
+    result_zero_offset = _mask_rasterize_into(
+        lon, lat, polygons, numbers=[0], offset=(0, 0)
+    )
     result_offset = _mask_rasterize(lon, lat, polygons, numbers=[0])
 
-    np.testing.assert_equal(result_no_offset, result_offset)
+    np.testing.assert_equal(result_zero_offset, result_offset)
 
 
 # =============================================================================
@@ -906,6 +1044,18 @@ def test_mask_whole_grid(method, regions, lon) -> None:
     assert mask.sel(lat=-90).isnull().all()
 
 
+def test_mask_edgepoints_shapely_no_edgepoints() -> None:
+
+    lon = np.arange(-175, 180, 10)
+    lat = np.arange(85, -90, -10)
+    mask = np.full((lat.size, lon.size), np.nan)
+
+    result = _mask_edgepoints_shapely(mask, lon, lat, r_GLOB_180.polygons, [0])
+
+    # returned unchanged if no gridpoint lies at -180°E/0°E or -90°N
+    assert result is mask
+
+
 @pytest.mark.parametrize("method", MASK_METHODS)
 @pytest.mark.parametrize("regions", [r_GLOB_180, r_GLOB_360])
 @pytest.mark.parametrize("lon", [lon180, lon360])
@@ -4,9 +4,15 @@ from pathlib import Path
 import pytest
 
 import regionmask
+from regionmask.core.options import _VALIDATORS, OPTIONS
 from regionmask.defined_regions._ressources import _get_cache_dir
 
 
+def test_options_have_validators() -> None:
+
+    assert set(OPTIONS) == set(_VALIDATORS)
+
+
 @pytest.mark.parametrize("invalid_option", [None, "None", "__foo__"])
 def test_option_invalid_error(invalid_option) -> None:
 
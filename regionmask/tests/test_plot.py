@@ -1,4 +1,5 @@
 import contextlib
+from collections.abc import Mapping
 from typing import Any, TypedDict, cast
 
 from packaging.version import Version
@@ -24,10 +25,12 @@ import regionmask
 from regionmask import Regions, plot_3D_mask
 from regionmask.core.plot import (
     _check_unused_kws,
-    _flatten_polygons,
     _maybe_gca,
+    _natural_earth_feature,
     _polygons_coords,
 )
+from regionmask.core.regions import _MAX_CACHED_OUTLINES
+from regionmask.core.utils import _flatten_polygons
 from regionmask.tests import assert_no_warnings, requires_cartopy, requires_matplotlib
 
 
@@ -166,6 +169,19 @@ def test_flatten_polygons() -> None:
     assert result[0].equals(poly1)
 
 
+@pytest.mark.parametrize("obj", [1, "a", None])
+def test_flatten_polygons_no_geometry(obj) -> None:
+
+    with pytest.raises(TypeError, match="Expected 'Polygon' or 'MultiPolygon'"):
+        _flatten_polygons([obj, poly1])
+
+    result = _flatten_polygons([obj, poly1, multipoly], error="skip")
+    assert len(result) == 3
+    assert result[0].equals(poly1)
+    assert result[1].equals(poly1)
+    assert result[2].equals(poly2)
+
+
 def test_polygons_coords() -> None:
 
     result = _polygons_coords([poly1, poly2])
@@ -379,6 +395,42 @@ def test_plot_lines_tolerance(plotfunc) -> None:
         assert np.allclose(lines[0].vertices.shape, (201, 2))
 
 
+def test_outlines_cached() -> None:
+
+    r = Regions(outlines)
+
+    result = r._outlines(tolerance=1 / 50)
+    assert len(result) == 2
+    assert result[0].shape == (201, 2)
+    assert not result[0].flags.writeable
+
+    # segmentized coords are reused
+    assert r._outlines(tolerance=1 / 50) is result
+    assert r._outlines(tolerance=None) is not result
+
+    # the cache is bounded
+    for tolerance in range(1, 10):
+        r._outlines(tolerance)
+    assert len(r._outlines_cache) == _MAX_CACHED_OUTLINES
+
+    # the cache is not shared with a subset
+    subset = r[[1]]
+    result = subset._outlines(tolerance=1 / 50)
+    assert len(result) == 1
+    np.testing.assert_allclose(result[0][[0, -1]], [outl2[0], outl2[0]])
+
+
+@requires_matplotlib
+@pytest.mark.parametrize("tolerance", [None, "auto", 1])
+def test_plot_regions_empty(tolerance) -> None:
+
+    with figure_context():
+        ax = Regions([]).plot_regions(tolerance=tolerance)
+        lines = ax.collections[0].get_paths()
+
+        assert len(lines) == 0
+
+
 @requires_matplotlib
 @pytest.mark.parametrize("plotfunc", PLOTFUNCS)
 def test_plot_lines_tolerance_None(plotfunc) -> None:
@@ -404,7 +456,8 @@ def test_plot_lines_tolerance_auto(plotfunc, kwargs) -> None:
 
     func = getattr(r_large, plotfunc)
 
-    expected = (41, 2) if plotfunc == "plot" else (5, 2)
+    # not segmentized on matplotlib axes and on the default PlateCarree projection
+    expected = (5, 2)
 
     with figure_context():
         ax = func(**kwargs, **maybe_no_coastlines(plotfunc))
@@ -415,13 +468,23 @@ def test_plot_lines_tolerance_auto(plotfunc, kwargs) -> None:
 
 
 @requires_cartopy
-def test_plot_regions_lines_tolerance_cartopy_axes() -> None:
+@pytest.mark.parametrize(
+    "projection, kwargs, expected",
+    [
+        ("Robinson", {}, (41, 2)),
+        ("PlateCarree", {"central_longitude": 180}, (41, 2)),
+        ("PlateCarree", {}, (5, 2)),
+    ],
+)
+def test_plot_regions_lines_tolerance_cartopy_axes(
+    projection, kwargs, expected
+) -> None:
 
-    expected = (41, 2)
+    projection = getattr(ccrs, projection)(**kwargs)
 
-    # when passing GeoAxes -> auto segmentizes lines
+    # when passing GeoAxes -> auto segmentizes lines (unless they are not transformed)
     with figure_context():
-        ax = r_large.plot_regions(ax=plt.axes(projection=ccrs.PlateCarree()))
+        ax = r_large.plot_regions(ax=plt.axes(projection=projection))
 
         lines = ax.collections[0].get_paths()
 
@@ -550,12 +613,17 @@ def test_plot_label_multipolygon(plotfunc) -> None:
         assert texts[0].get_text() == "0"
         assert texts[1].get_text() == "0"
 
+        # labels are placed at the centroid of each polygon
+        np.testing.assert_allclose(texts[0].get_position(), (0.5, 0.5))
+        np.testing.assert_allclose(texts[1].get_position(), (0.5, 1.5))
+
     with figure_context():
         ax = func(tolerance=None, add_label=True, label_multipolygon="largest")
         texts = ax.texts
 
         assert len(texts) == 1
         assert texts[0].get_text() == "0"
+        np.testing.assert_allclose(texts[0].get_position(), (0.5, 0.5))
 
 
 @requires_matplotlib
@@ -578,6 +646,34 @@ def test_plot_text_prop(plotfunc) -> None:
         bbox = texts[0].get_bbox_patch()
         assert bbox.get_edgecolor() == (0.85, 0.85, 0.85, 1.0)
 
+    # the passed text_kws are not modified
+    text_kws = dict(va="top", backgroundcolor="r", clip_on=False)
+    with figure_context():
+        ax = func(tolerance=None, add_label=True, text_kws=text_kws)
+
+        assert ax.texts[0].get_va() == "top"
+        assert text_kws == dict(va="top", backgroundcolor="r", clip_on=False)
+
+    # any mapping can be passed
+    class KwsMapping(Mapping):
+        def __init__(self, **kwargs):
+            self._kwargs = kwargs
+
+        def __getitem__(self, key):
+            return self._kwargs[key]
+
+        def __iter__(self):
+            return iter(self._kwargs)
+
+        def __len__(self):
+            return len(self._kwargs)
+
+    text_kws_mapping = KwsMapping(va="top")
+    with figure_context():
+        ax = func(tolerance=None, add_label=True, text_kws=text_kws_mapping)
+
+        assert ax.texts[0].get_va() == "top"
+
 
 @requires_matplotlib
 @pytest.mark.parametrize("plotfunc", PLOTFUNCS)
@@ -793,6 +889,19 @@ def test_check_unused_kws() -> None:
         _check_unused_kws(False, {}, "feature_name", "kws_name")
 
 
+@requires_cartopy
+def test_natural_earth_feature() -> None:
+
+    result = _natural_earth_feature("physical", "ocean", "110m")
+
+    assert result.name == "ocean"
+    assert result.scale == "110m"
+
+    # the feature is reused
+    assert _natural_earth_feature("physical", "ocean", "110m") is result
+    assert _natural_earth_feature("physical", "ocean", "50m") is not result
+
+
 @requires_matplotlib
 @pytest.mark.parametrize("plotfunc", PLOTFUNCS)
 def test_plot_no_warning_default(plotfunc) -> None:
@@ -1,13 +1,14 @@
 import numpy as np
 import pytest
 
-from regionmask.core.plot import _get_tolerance, segmentize
+from regionmask.core.plot import _get_tolerance, _segmentize_rings, segmentize
 
 
 def test_get_tolerance() -> None:
 
     assert _get_tolerance(0) == 1
     assert _get_tolerance(-1) == 1
+    assert _get_tolerance(0.5) == 1
     assert _get_tolerance(360) == 1
     assert _get_tolerance([-1, 20]) == 1
     assert _get_tolerance(999) == 1
@@ -63,6 +64,38 @@ def test_segmentize_mixed_length() -> None:
     assert np.allclose(expected, result)
 
 
+def test_segmentize_dtype() -> None:
+
+    # always returns floats - also if no vertex is added
+    result = segmentize([[0, 0], [0, 1]], tolerance=1)
+    assert result.dtype == float
+
+    result = segmentize([[0, 0], [0, 2]], tolerance=1)
+    assert result.dtype == float
+
+
+def test_segmentize_short_segments() -> None:
+    # all segments are shorter than the tolerance
+
+    coords = np.array([[0, 0], [0.5, 0.5], [1, 0.5], [1, 1]])
+
+    result = segmentize(coords, tolerance=1)
+    np.testing.assert_equal(result, coords)
+
+    result = segmentize(coords[:1], tolerance=1)
+    np.testing.assert_equal(result, coords[:1])
+
+
+def test_segmentize_zero_length() -> None:
+    # duplicated vertices are kept
+
+    outl = ((0, 0), (0, 0), (0, 2), (0, 2))
+    result = segmentize(outl, tolerance=1)
+    expected = ((0, 0), (0, 0), (0, 1), (0, 2), (0, 2))
+
+    np.testing.assert_allclose(expected, result)
+
+
 @pytest.mark.parametrize("number", [1, 2, 5, 20, 100])
 def test_segmentize_n_segments(number) -> None:
 
@@ -107,3 +140,25 @@ def test_segmentize_shapely(coords, tolerance) -> None:
     result = shapely.linestrings(result)
 
     shapely.testing.assert_geometries_equal(result, expected)
+
+
+@pytest.mark.parametrize("tolerance", [0.3, 1.0, 10])
+def test_segmentize_rings(tolerance) -> None:
+
+    rings = [
+        np.array([[0, 0], [0, 1], [1, 1], [1, 0], [0, 0]]),
+        np.array([[5, 5], [5, 7.5], [8, 5], [5, 5]]),
+        np.array([[-3, 0], [0, -3], [-3, -3], [-3, 0]]),
+    ]
+
+    result = _segmentize_rings(rings, tolerance)
+    expected = [segmentize(ring, tolerance) for ring in rings]
+
+    assert len(result) == len(expected)
+    for r, e in zip(result, expected, strict=True):
+        np.testing.assert_equal(r, e)
+
+
+def test_segmentize_rings_empty() -> None:
+
+    assert _segmentize_rings([], 1) == []